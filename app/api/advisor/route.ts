@@ -47,7 +47,7 @@ export async function POST(req: NextRequest) {
   }
 
   let messages: Array<{ role: "user" | "assistant"; content: string }> = [];
-  let snapshot: unknown = {};
+  let snapshotJson = "{}";
   try {
     const body = await req.json();
     messages = Array.isArray(body.messages)
@@ -60,8 +60,9 @@ export async function POST(req: NextRequest) {
           .slice(-12)
           .map((m: any) => ({ role: m.role, content: m.content.slice(0, 4000) }))
       : [];
-    snapshot = body.snapshot ?? {};
-    if (JSON.stringify(snapshot).length > 150_000) {
+    // Serialize once: the same string is size-checked and sent to the model.
+    snapshotJson = JSON.stringify(body.snapshot ?? {});
+    if (snapshotJson.length > 150_000) {
       return NextResponse.json({ error: "That snapshot is too large." }, { status: 413 });
     }
   } catch {
@@ -70,7 +71,7 @@ export async function POST(req: NextRequest) {
 
   const snapshotMsg =
     "Here is the user's current financial snapshot (JSON). Use these real numbers:\n" +
-    JSON.stringify(snapshot);
+    snapshotJson;
 
   try {
     const res: any = await getClient().messages.create({
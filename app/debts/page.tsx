@@ -8,8 +8,8 @@ import {
 } from "lucide-react";
 import { useStore } from "@/lib/store";
 import {
-  DEBT_KIND_IS_ORG, inferDebtKind, payoffPlan, payoffProjection,
-  simulatePayoff, suggestPersonPayment,
+  DEBT_KIND_IS_ORG, inferDebtKind, payoffPlan, simulatePayoff,
+  simulatePayoffSeries, suggestPersonPayment,
 } from "@/lib/insights";
 import { clampPct, formatMoney, friendlyDate, monthKey } from "@/lib/format";
 import { success } from "@/lib/haptics";
@@ -58,8 +58,11 @@ export default function DebtsPage() {
 
   const all = useMemo(() => (data?.debts || []).filter((d) => d.balance > 0), [data]);
   const iOwe = all.filter((d) => d.direction === "i_owe");
-  const orgs = iOwe.filter((d) => DEBT_KIND_IS_ORG[d.kind ?? inferDebtKind(d)]);
-  const peopleIOwe = iOwe.filter((d) => !DEBT_KIND_IS_ORG[d.kind ?? inferDebtKind(d)]);
+  // Resolve each debt's kind once (inferDebtKind runs several regexes) and
+  // split in a single pass, rather than re-deriving it for each filter.
+  const orgs: Debt[] = [];
+  const peopleIOwe: Debt[] = [];
+  for (const d of iOwe) (DEBT_KIND_IS_ORG[d.kind ?? inferDebtKind(d)] ? orgs : peopleIOwe).push(d);
   const owedToMe = all.filter((d) => d.direction === "owed_to_me");
 
   const planTargets = orgs.concat(peopleIOwe);
@@ -69,11 +72,15 @@ export default function DebtsPage() {
   const monthlyMin = planTargets.reduce((s, d) => s + (d.minPayment || 0), 0);
 
   // Real what-if math — interest-accruing simulation, not a guessed curve.
-  const sim = simulatePayoff(data!, method, extra);
-  const baseline = simulatePayoff(data!, method, 0);
+  // Memoized on its inputs so typing in the debt/payment sheets doesn't re-run
+  // month-by-month simulations; the no-extra baseline ignores the slider.
+  const baseline = useMemo(() => simulatePayoff(data!, method, 0), [data, method]);
+  // One run feeds both the what-if numbers and the projection chart.
+  const { sim, projection, plan } = useMemo(() => {
+    const run = simulatePayoffSeries(data!, method, extra);
+    return { sim: run, projection: run.series, plan: payoffPlan(data!, method, extra) };
+  }, [data, method, extra]);
   const interestSaved = Math.max(0, baseline.totalInterest - sim.totalInterest);
-  const projection = payoffProjection(data!, method, extra);
-  const plan = payoffPlan(data!, method, extra);
   const targetDate = sim.months
     ? new Date(new Date().getFullYear(), new Date().getMonth() + sim.months, 1)
     : null;
@@ -1,12 +1,12 @@
 "use client";
 
-import { useEffect, useRef, useState } from "react";
+import { useEffect, useMemo, useRef, useState } from "react";
 import Link from "next/link";
 import gsap from "gsap";
 import { ArrowRight, Pencil, Plus, ReceiptText, Trash2, TrendingDown, TrendingUp, Wallet, X } from "lucide-react";
 import { useStore, summarize } from "@/lib/store";
 import { budgetStatus, cashOnHand, categoryBreakdown, monthOverMonth, monthPace, monthlyTotals, netWorth } from "@/lib/insights";
-import { formatMoney } from "@/lib/format";
+import { formatMoney, todayISO } from "@/lib/format";
 import type { AccountType } from "@/lib/types";
 import AnimatedNumber from "@/components/AnimatedNumber";
 import Donut from "@/components/Donut";
@@ -39,17 +39,36 @@ export default function SpendingPage() {
     return () => ctx.revert();
   }, [ready]);
 
+  // Hooks must run unconditionally; the data they read is stable while !ready.
+  // Chart inputs depend on `data` and the current day/month, so key them on
+  // both: typing in the account sheet doesn't rebuild every breakdown and
+  // trend per keystroke, but pace and month views still roll over with the date.
+  const today = todayISO();
+  const { summary, cats, budgets, mom, paceLine, trend, nw, cash, merchants } = useMemo(() => {
+    const merchantMap = new Map<string, { category: string; amount: number }>();
+    for (const t of data.transactions) {
+      if (t.type !== "expense") continue;
+      const key = t.description || t.category;
+      const prev = merchantMap.get(key) || { category: t.category, amount: 0 };
+      merchantMap.set(key, { category: prev.category, amount: prev.amount + t.amount });
+    }
+    return {
+      summary: summarize(data),
+      cats: categoryBreakdown(data),
+      budgets: budgetStatus(data),
+      mom: monthOverMonth(data),
+      paceLine: monthPace(data),
+      trend: monthlyTotals(data, 7),
+      nw: netWorth(data),
+      cash: cashOnHand(data),
+      merchants: [...merchantMap.entries()].map(([name, v]) => ({ name, ...v })).sort((a, b) => b.amount - a.amount).slice(0, 5),
+    };
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [data, today]);
+
   if (!ready) return null;
 
   const cur = data.currency;
-  const summary = summarize(data);
-  const cats = categoryBreakdown(data);
-  const budgets = budgetStatus(data);
-  const mom = monthOverMonth(data);
-  const paceLine = monthPace(data);
-  const trend = monthlyTotals(data, 7);
-  const nw = netWorth(data);
-  const cash = cashOnHand(data);
   const accounts = data.accounts || [];
   const nwHist = data.netWorthHistory || [];
   const lastMonthNw = nwHist.length >= 2 ? nwHist[nwHist.length - 2].value : null;
@@ -60,14 +79,6 @@ export default function SpendingPage() {
   const trendVals = trend.map((m) => m.expense);
   const hasExpenses = data.transactions.some((t) => t.type === "expense");
 
-  const merchantMap = new Map<string, { category: string; amount: number }>();
-  for (const t of data.transactions.filter((t) => t.type === "expense")) {
-    const key = t.description || t.category;
-    const prev = merchantMap.get(key) || { category: t.category, amount: 0 };
-    merchantMap.set(key, { category: prev.category, amount: prev.amount + t.amount });
-  }
-  const merchants = [...merchantMap.entries()].map(([name, v]) => ({ name, ...v })).sort((a, b) => b.amount - a.amount).slice(0, 5);
-
   function saveAcct() {
     if (!draft) return;
     const balance = parseFloat(draft.balance);
@@ -35,14 +35,14 @@ export default function LedgerPage() {
   // Hooks must run unconditionally; the data they read is stable while !ready.
   const months = useMemo(() => {
     const needle = q.trim().toLowerCase();
+    // One filter pass builds the only copy we sort — no intermediate arrays.
     const list = data.transactions
-      .filter((t) => (filter === "all" ? true : t.type === filter))
       .filter((t) =>
-        !needle ||
-        (t.description || "").toLowerCase().includes(needle) ||
-        t.category.toLowerCase().includes(needle)
+        (filter === "all" || t.type === filter) &&
+        (!needle ||
+          (t.description || "").toLowerCase().includes(needle) ||
+          t.category.toLowerCase().includes(needle))
       )
-      .slice()
       .sort((a, b) => (a.date < b.date ? 1 : a.date > b.date ? -1 : b.createdAt - a.createdAt));
     const by = new Map<string, { txs: Transaction[]; net: number }>();
     for (const t of list) {
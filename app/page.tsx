@@ -1,6 +1,6 @@
 "use client";
 
-import { useEffect, useRef, useState } from "react";
+import { useEffect, useMemo, useRef, useState } from "react";
 import Link from "next/link";
 import gsap from "gsap";
 import { Flame, Sparkles, Trash2, X } from "lucide-react";
@@ -15,7 +15,7 @@ import {
   worthKnowing,
   paycheckPlan,
 } from "@/lib/insights";
-import { formatMoney, friendlyDate, isoWeekId, monthKey, monthLabel, prevMonthKey } from "@/lib/format";
+import { formatMoney, friendlyDate, isoWeekId, monthKey, monthLabel, prevMonthKey, todayISO } from "@/lib/format";
 import { success } from "@/lib/haptics";
 import AnimatedNumber from "@/components/AnimatedNumber";
 import QuickCapture from "@/components/QuickCapture";
@@ -122,27 +122,36 @@ export default function TodayPage() {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [ready]);
 
+  // Hooks must run unconditionally; the data they read is stable while !ready.
+  // The insight selectors depend on `data` and the clock, so key them on both:
+  // typing in the edit or balance sheets doesn't re-run them per keystroke,
+  // but an app left open overnight still rolls over to the new day.
+  const today = todayISO();
+  const { summary, cash, nw, sts, knowables, noSpend, streak, paycheck } = useMemo(
+    () => ({
+      summary: summarize(data),
+      cash: cashOnHand(data),
+      nw: netWorth(data),
+      sts: safeToSpend(data),
+      knowables: worthKnowing(data, 4),
+      noSpend: noSpendStreak(data),
+      streak: loggingStreak(data),
+      paycheck: paycheckPlan(data),
+    }),
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+    [data, today],
+  );
+
   if (!ready) return null;
 
-  const summary = summarize(data);
   const firstName = data.members[0]?.name?.split(" ")[0] || "there";
-  const cash = cashOnHand(data);
-  const nw = netWorth(data);
-  const sts = safeToSpend(data);
   const recent = data.transactions.slice(0, 5);
-  const knowables = worthKnowing(data, 4);
-  const noSpend = noSpendStreak(data);
   const safePos = sts.safe >= 0;
   const cur = data.currency;
   const barPct = sts.spendable > 0 ? Math.max(0, Math.min(100, (sts.safe / sts.spendable) * 100)) : safePos ? 60 : 8;
-  const streak = loggingStreak(data);
   const dateLine = new Date().toLocaleDateString(undefined, { weekday: "long", month: "long", day: "numeric" });
   const checkInDue = data.remindersEnabled && (!data.lastCheckIn || Date.now() - data.lastCheckIn > 7 * 86400000);
-  const payday = (() => {
-    const plan = paycheckPlan(data);
-    if (!plan || data.lastPaycheckDistributed === monthKey()) return null;
-    return plan;
-  })();
+  const payday = paycheck && data.lastPaycheckDistributed !== monthKey() ? paycheck : null;
 
   return (
     <main className="pg" ref={root}>
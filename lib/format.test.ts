@@ -1,5 +1,5 @@
 import { describe, expect, it } from "vitest";
-import { formatMoney, clampPct } from "./format";
+import { formatMoney, formatMoneyShort, clampPct, friendlyDate, monthLabel } from "./format";
 
 describe("formatMoney", () => {
   it("formats whole and fractional amounts", () => {
@@ -11,6 +11,29 @@ describe("formatMoney", () => {
     expect(formatMoney(Infinity, "USD")).toBe("$0");
     expect(formatMoney(-Infinity, "USD")).toBe("$0");
   });
+  it("keeps currencies and precision apart when reusing formatters", () => {
+    expect(formatMoney(8.4, "USD")).toBe("$8.40");
+    expect(formatMoney(8.4, "EUR")).toBe("€8.40");
+    expect(formatMoney(8, "EUR")).toBe("€8");
+    expect(formatMoney(8, "USD")).toBe("$8");
+  });
+});
+
+describe("formatMoneyShort", () => {
+  it("compacts large amounts without leaking into formatMoney", () => {
+    expect(formatMoneyShort(1200, "USD")).toBe("$1.2K");
+    expect(formatMoneyShort(850, "USD")).toBe("$850");
+    expect(formatMoney(1200, "USD")).toBe("$1,200");
+  });
+});
+
+describe("dates", () => {
+  it("labels older days and months through the shared formatters", () => {
+    expect(friendlyDate("2020-05-12")).toBe("May 12");
+    expect(friendlyDate("2020-12-03")).toBe("Dec 3");
+    expect(monthLabel("2026-05")).toBe("May");
+    expect(monthLabel("2026-01")).toBe("January");
+  });
 });
 
 describe("clampPct", () => {
@@ -1,39 +1,57 @@
+// Building an Intl.NumberFormat costs far more than calling .format() on one,
+// and every screen formats dozens of amounts per render — so keep one
+// formatter per currency + precision (+ compact notation) and reuse it.
+const moneyFormatters = new Map<string, Intl.NumberFormat>();
+
+function moneyFormatter(currency: string, maximumFractionDigits: number, compact = false): Intl.NumberFormat {
+  const key = `${currency}:${maximumFractionDigits}${compact ? ":c" : ""}`;
+  let f = moneyFormatters.get(key);
+  if (!f) {
+    f = new Intl.NumberFormat(undefined, {
+      style: "currency",
+      currency,
+      maximumFractionDigits,
+      ...(compact ? { notation: "compact" as const } : {}),
+    });
+    moneyFormatters.set(key, f);
+  }
+  return f;
+}
+
 export function formatMoney(amount: number, currency = "USD"): string {
   // Never render "$NaN" / "$∞" — coerce bad inputs to 0 defensively.
   const n = Number.isFinite(amount) ? amount : 0;
-  return new Intl.NumberFormat(undefined, {
-    style: "currency",
-    currency,
-    maximumFractionDigits: Math.abs(n) % 1 === 0 ? 0 : 2,
-  }).format(n);
+  return moneyFormatter(currency, Math.abs(n) % 1 === 0 ? 0 : 2).format(n);
 }
 
 // Compact money for tight chart labels: $1.2k, $850.
 export function formatMoneyShort(amount: number, currency = "USD"): string {
   const abs = Math.abs(amount);
-  if (abs >= 1000) {
-    return new Intl.NumberFormat(undefined, {
-      style: "currency",
-      currency,
-      notation: "compact",
-      maximumFractionDigits: 1,
-    }).format(amount);
-  }
+  if (abs >= 1000) return moneyFormatter(currency, 1, true).format(amount);
   return formatMoney(amount, currency);
 }
 
-export function todayISO(): string {
-  const d = new Date();
+// Local "YYYY-MM-DD" for a given date (defaults to now).
+export function dayKey(d: Date = new Date()): string {
   const y = d.getFullYear();
   const m = String(d.getMonth() + 1).padStart(2, "0");
   const day = String(d.getDate()).padStart(2, "0");
   return `${y}-${m}-${day}`;
 }
 
+export function todayISO(): string {
+  return dayKey();
+}
+
 export function uid(): string {
   return Math.random().toString(36).slice(2) + Date.now().toString(36);
 }
 
+// Same reasoning for dates: toLocaleDateString builds a formatter on every
+// call, and friendlyDate runs once per ledger row.
+const shortDayFormat = new Intl.DateTimeFormat(undefined, { month: "short", day: "numeric" });
+const longMonthFormat = new Intl.DateTimeFormat(undefined, { month: "long" });
+
 // Friendly relative date, e.g. "Today", "Yesterday", "May 12".
 export function friendlyDate(iso: string): string {
   const d = new Date(iso + "T00:00:00");
@@ -43,7 +61,7 @@ export function friendlyDate(iso: string): string {
   if (diff === 0) return "Today";
   if (diff === 1) return "Yesterday";
   if (diff > 1 && diff < 7) return `${diff} days ago`;
-  return d.toLocaleDateString(undefined, { month: "short", day: "numeric" });
+  return shortDayFormat.format(d);
 }
 
 // "YYYY-MM" for a given date (defaults to now).
@@ -62,7 +80,7 @@ export function prevMonthKey(d: Date = new Date()): string {
 // Human month label, e.g. "May".
 export function monthLabel(key: string): string {
   const [y, m] = key.split("-").map(Number);
-  return new Date(y, m - 1, 1).toLocaleDateString(undefined, { month: "long" });
+  return longMonthFormat.format(new Date(y, m - 1, 1));
 }
 
 // Initials from a name, for avatars when no emoji.
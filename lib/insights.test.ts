@@ -2,13 +2,16 @@ import { describe, expect, it } from "vitest";
 import type { AppData } from "./types";
 import {
   inferDebtKind,
+  loggingStreak,
   monthPace,
+  noSpendStreak,
   payoffProjection,
   safeToSpend,
   simulatePayoff,
+  simulatePayoffSeries,
   spendableCash,
 } from "./insights";
-import { monthKey, todayISO } from "./format";
+import { dayKey, monthKey, todayISO } from "./format";
 
 function base(overrides: Partial<AppData> = {}): AppData {
   return {
@@ -232,6 +235,35 @@ describe("payoffProjection", () => {
   });
 });
 
+describe("simulatePayoff", () => {
+  const card = (balance: number, apr: number, minPayment: number) =>
+    base({ debts: [{ id: "d1", direction: "i_owe", party: "Card A", balance, apr, minPayment, createdAt: 0 }] });
+
+  it("agrees with payoffProjection on how many months it takes", () => {
+    const data = card(5000, 20, 100);
+    const sim = simulatePayoff(data, "avalanche", 300);
+    expect(sim.months).not.toBeNull();
+    expect(sim.months).toBe(payoffProjection(data, "avalanche", 300).length - 1);
+  });
+
+  it("returns the same numbers and chart series from a single run", () => {
+    const data = card(5000, 20, 100);
+    const run = simulatePayoffSeries(data, "avalanche", 300);
+    expect({ months: run.months, totalInterest: run.totalInterest }).toEqual(simulatePayoff(data, "avalanche", 300));
+    expect(run.series).toEqual(payoffProjection(data, "avalanche", 300));
+  });
+
+  it("accrues interest when a debt has an APR", () => {
+    expect(simulatePayoff(card(5000, 20, 100), "avalanche", 0).totalInterest).toBeGreaterThan(0);
+    expect(simulatePayoff(card(1000, 0, 100), "avalanche", 0).totalInterest).toBe(0);
+  });
+
+  it("returns null months when the minimums never cover the interest", () => {
+    // 24% APR on 10,000 accrues 200/month; a 50 minimum never catches up.
+    expect(simulatePayoff(card(10000, 24, 50), "snowball", 0).months).toBeNull();
+  });
+});
+
 describe("monthPace", () => {
   function txAt(monthsBack: number, day: number, amount: number) {
     const d = new Date();
@@ -262,3 +294,41 @@ describe("monthPace", () => {
     expect(p.typical).toBe(150);
   });
 });
+
+describe("streaks", () => {
+  function txDaysAgo(daysAgo: number, type: "expense" | "income" = "expense") {
+    const d = new Date();
+    const iso = dayKey(new Date(d.getFullYear(), d.getMonth(), d.getDate() - daysAgo));
+    return { id: `t${daysAgo}-${type}`, type, amount: 10, category: "Groceries", description: "", date: iso, createdAt: 0 };
+  }
+  const logged = (...daysAgo: number[]) => base({ transactions: daysAgo.map((n) => txDaysAgo(n)) });
+
+  describe("loggingStreak", () => {
+    it("counts back from today when today is logged", () => {
+      expect(loggingStreak(logged(0, 1, 2))).toEqual({ count: 3, loggedToday: true, best: 3 });
+    });
+    it("stays alive through yesterday when today isn't logged yet", () => {
+      expect(loggingStreak(logged(1, 2))).toEqual({ count: 2, loggedToday: false, best: 2 });
+    });
+    it("stops at a one-day gap", () => {
+      expect(loggingStreak(logged(0, 2, 3)).count).toBe(1);
+    });
+    it("keeps the best run from before a gap", () => {
+      expect(loggingStreak(logged(0, 7, 8, 9, 10))).toEqual({ count: 1, loggedToday: true, best: 4 });
+    });
+  });
+
+  describe("noSpendStreak", () => {
+    it("is zero with no history or a spend today", () => {
+      expect(noSpendStreak(base())).toBe(0);
+      expect(noSpendStreak(logged(0, 5))).toBe(0);
+    });
+    it("stops at the most recent spend day", () => {
+      const data = base({ transactions: [txDaysAgo(0, "income"), txDaysAgo(3), txDaysAgo(10)] });
+      expect(noSpendStreak(data)).toBe(3);
+    });
+    it("never counts days before the first entry", () => {
+      expect(noSpendStreak(base({ transactions: [txDaysAgo(2, "income")] }))).toBe(3);
+    });
+  });
+});
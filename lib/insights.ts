@@ -1,5 +1,5 @@
 import type { AppData, Debt, DebtKind, RecurringBill } from "./types";
-import { monthKey, prevMonthKey, formatMoney } from "./format";
+import { dayKey, monthKey, prevMonthKey, formatMoney } from "./format";
 
 // The household's monthly income baseline: this month's logged income if any,
 // otherwise the sum of members' stated monthly incomes (or legacy single value).
@@ -281,13 +281,15 @@ export function cashOnHand(data: AppData): number {
 
 // --- engagement: daily logging streak --------------------------------------
 
-function localDayMinus(n: number): string {
+// Walks back one local day per call from today, reusing a single Date rather
+// than building a fresh one for every day of a (up to year-long) streak.
+function dayWalker(): () => string {
   const d = new Date();
-  d.setDate(d.getDate() - n);
-  const y = d.getFullYear();
-  const m = String(d.getMonth() + 1).padStart(2, "0");
-  const day = String(d.getDate()).padStart(2, "0");
-  return `${y}-${m}-${day}`;
+  return () => {
+    const out = dayKey(d);
+    d.setDate(d.getDate() - 1);
+    return out;
+  };
 }
 
 export interface Streak {
@@ -302,31 +304,33 @@ export interface Streak {
 export function loggingStreak(data: AppData): Streak {
   const days = new Set<string>();
   for (const t of data.transactions) days.add(t.date.slice(0, 10));
-  const loggedToday = days.has(localDayMinus(0));
+  const next = dayWalker();
+  const loggedToday = days.has(next());
 
-  let count = 0;
-  let offset = loggedToday ? 0 : 1; // if not logged today, start from yesterday
-  while (days.has(localDayMinus(offset))) {
+  // Today counts if logged; either way the walk continues from yesterday.
+  let count = loggedToday ? 1 : 0;
+  let day = next();
+  while (days.has(day)) {
     count++;
-    offset++;
+    day = next();
   }
 
-  // Longest run anywhere in history.
+  // Longest run anywhere in history. Each day is parsed once; the previous
+  // day's timestamp is carried forward instead of re-parsed.
   const sorted = [...days].sort();
   let best = 0;
   let run = 0;
-  let prev: string | null = null;
+  let prevTime: number | null = null;
   for (const d of sorted) {
-    if (prev) {
-      const a = new Date(prev + "T00:00:00");
-      const b = new Date(d + "T00:00:00");
-      const gap = Math.round((b.getTime() - a.getTime()) / 86400000);
+    const time = new Date(d + "T00:00:00").getTime();
+    if (prevTime !== null) {
+      const gap = Math.round((time - prevTime) / 86400000);
       run = gap === 1 ? run + 1 : 1;
     } else {
       run = 1;
     }
     best = Math.max(best, run);
-    prev = d;
+    prevTime = time;
   }
 
   return { count, loggedToday, best: Math.max(best, count) };
@@ -345,8 +349,9 @@ export function noSpendStreak(data: AppData): number {
     if (t.type === "expense") spendDays.add(d);
   }
   let count = 0;
+  const next = dayWalker();
   for (let offset = 0; offset <= 366; offset++) {
-    const day = localDayMinus(offset);
+    const day = next();
     if (day < earliest) break;
     if (spendDays.has(day)) break;
     count++;
@@ -766,18 +771,27 @@ export interface PayoffSim {
   totalInterest: number;
 }
 
-// Simulate paying off all "I owe" debts with the given method + extra/month,
-// accruing monthly interest. Used by the what-if slider.
-export function simulatePayoff(
+export interface PayoffRun extends PayoffSim {
+  series: number[]; // remaining total after each month, starting with today's
+}
+
+// One month-by-month payoff engine shared by simulatePayoff and
+// payoffProjection, so the what-if numbers and the chart can never drift
+// apart. Accrues monthly interest, pays every minimum, then funnels the rest by
+// method order. `series` (remaining total after each month, starting with
+// today's) is only collected when asked for.
+function runPayoff(
   data: AppData,
   method: "snowball" | "avalanche",
   extraPerMonth: number,
-  maxMonths = 720,
-): PayoffSim {
+  maxMonths: number,
+  withSeries: boolean,
+): PayoffRun {
   const bal = data.debts
     .filter((d) => d.direction === "i_owe" && d.balance > 0)
     .map((d) => ({ balance: d.balance, apr: d.apr || 0, min: d.minPayment || 0 }));
-  if (bal.length === 0) return { months: 0, totalInterest: 0 };
+  const series: number[] = withSeries ? [bal.reduce((s, d) => s + d.balance, 0)] : [];
+  if (bal.length === 0) return { months: 0, totalInterest: 0, series };
 
   const order = [...bal].sort((a, b) =>
     method === "snowball" ? a.balance - b.balance : b.apr - a.apr,
@@ -814,8 +828,32 @@ export function simulatePayoff(
         pool -= pay;
       }
     }
+    if (withSeries) series.push(Math.max(0, bal.reduce((s, d) => s + d.balance, 0)));
   }
-  return { months: months >= maxMonths ? null : months, totalInterest };
+  return { months: months >= maxMonths ? null : months, totalInterest, series };
+}
+
+// Simulate paying off all "I owe" debts with the given method + extra/month,
+// accruing monthly interest. Used by the what-if slider.
+export function simulatePayoff(
+  data: AppData,
+  method: "snowball" | "avalanche",
+  extraPerMonth: number,
+  maxMonths = 720,
+): PayoffSim {
+  const { months, totalInterest } = runPayoff(data, method, extraPerMonth, maxMonths, false);
+  return { months, totalInterest };
+}
+
+// simulatePayoff and payoffProjection from a single run, for screens that show
+// both the what-if numbers and the chart.
+export function simulatePayoffSeries(
+  data: AppData,
+  method: "snowball" | "avalanche",
+  extraPerMonth: number,
+  maxMonths = 720,
+): PayoffRun {
+  return runPayoff(data, method, extraPerMonth, maxMonths, true);
 }
 
 // Month-by-month total remaining balance under a given method + extra payment,
@@ -827,39 +865,7 @@ export function payoffProjection(
   extraPerMonth: number,
   maxMonths = 600,
 ): number[] {
-  const bal = data.debts
-    .filter((d) => d.direction === "i_owe" && d.balance > 0)
-    .map((d) => ({ balance: d.balance, apr: d.apr || 0, min: d.minPayment || 0 }));
-  const series: number[] = [bal.reduce((s, d) => s + d.balance, 0)];
-  if (bal.length === 0) return series;
-  const order = [...bal].sort((a, b) =>
-    method === "snowball" ? a.balance - b.balance : b.apr - a.apr,
-  );
-  let months = 0;
-  while (bal.some((d) => d.balance > 0.01) && months < maxMonths) {
-    months++;
-    for (const d of bal) {
-      if (d.balance > 0) d.balance += d.balance * (d.apr / 100 / 12);
-    }
-    let pool = bal.reduce((s, d) => s + (d.balance > 0 ? d.min : 0), 0) + extraPerMonth;
-    for (const d of bal) {
-      if (d.balance > 0 && pool > 0) {
-        const pay = Math.min(d.min, d.balance, pool);
-        d.balance -= pay;
-        pool -= pay;
-      }
-    }
-    for (const d of order) {
-      if (pool <= 0) break;
-      if (d.balance > 0) {
-        const pay = Math.min(pool, d.balance);
-        d.balance -= pay;
-        pool -= pay;
-      }
-    }
-    series.push(Math.max(0, bal.reduce((s, d) => s + d.balance, 0)));
-  }
-  return series;
+  return runPayoff(data, method, extraPerMonth, maxMonths, true).series;
 }
 
 export interface PayoffPlan {
@@ -925,8 +931,9 @@ export function worthKnowing(data: AppData, max = 3): Knowable[] {
   // Payday runway: project current discretionary pace forward to payday.
   if (sts.daysLeft > 0) {
     const dayOfMonth = new Date().getDate();
+    const month = monthKey(); // loop-invariant: don't rebuild it per transaction
     const monthSpend = data.transactions
-      .filter((t) => t.type === "expense" && t.date.startsWith(monthKey()) && t.category !== "Debt payment")
+      .filter((t) => t.type === "expense" && t.date.startsWith(month) && t.category !== "Debt payment")
       .reduce((s, t) => s + t.amount, 0);
     const dailyAvg = dayOfMonth > 0 ? monthSpend / dayOfMonth : 0;
     if (dailyAvg > 0) {
@@ -947,16 +954,13 @@ export function worthKnowing(data: AppData, max = 3): Knowable[] {
   {
     const billNames = new Set((data.recurringBills || []).map((b) => b.name.toLowerCase().trim()));
     const now = new Date();
-    const recent = [0, 1, 2].map((i) => {
-      const d = new Date(now.getFullYear(), now.getMonth() - i, 1);
-      return `${d.getFullYear()}-${String(d.getMonth() + 1).padStart(2, "0")}`;
-    });
+    const recent = new Set([0, 1, 2].map((i) => monthKey(new Date(now.getFullYear(), now.getMonth() - i, 1))));
     const monthsSeen = new Map<string, Set<string>>();
     const lastAmt = new Map<string, number>();
     for (const t of data.transactions) {
       if (t.type !== "expense" || t.category === "Debt payment") continue;
       const mo = t.date.slice(0, 7);
-      if (!recent.includes(mo)) continue;
+      if (!recent.has(mo)) continue;
       const key = (t.description || t.category).trim();
       if (!key || billNames.has(key.toLowerCase())) continue;
       if (!monthsSeen.has(key)) monthsSeen.set(key, new Set());
@@ -972,10 +976,10 @@ export function worthKnowing(data: AppData, max = 3): Knowable[] {
   }
   // A category running hot vs last month (subscription / spending creep).
   const thisCats = categoryBreakdown(data);
-  const prevCats = categoryBreakdown(data, prevMonthKey());
+  const prevByCat = new Map(categoryBreakdown(data, prevMonthKey()).map((p) => [p.category, p.amount]));
   for (const c of thisCats) {
     if (c.category === "Debt payment") continue;
-    const prev = prevCats.find((p) => p.category === c.category)?.amount || 0;
+    const prev = prevByCat.get(c.category) || 0;
     if (prev > 0 && c.amount - prev >= 50 && c.amount >= prev * 1.3) {
       info.push({ tone: "info", text: `${c.category} is ${m(c.amount - prev)} higher than last month so far — worth a glance.` });
       break;
@@ -33,6 +33,13 @@ import { parseAppDataInput } from "./validation";
 const STORAGE_KEY = "money-coach-data-v1";
 const CURRENT_VERSION = 2;
 
+// Default emoji/colour for accounts and goals created from parsed entries.
+// Module-level so applyParsedEntries reads them instead of rebuilding them.
+const ACCT_EMOJI: Record<string, string> = {
+  checking: "🏦", savings: "🐷", cash: "💵", investment: "📈", other: "💼",
+};
+const PALETTE = ["#0f766e", "#14b8a6", "#5e7fa6", "#d99a4e", "#7c6ba8", "#2e8b72"];
+
 export type SyncState = "idle" | "syncing" | "ok" | "error" | "unconfigured";
 
 function freshData(): AppData {
@@ -747,10 +754,6 @@ export function StoreProvider({ children }: { children: React.ReactNode }) {
         let goals = d.goals || [];
         const now = Date.now();
         const owner = memberId ?? d.members[0]?.id;
-        const ACCT_EMOJI: Record<string, string> = {
-          checking: "🏦", savings: "🐷", cash: "💵", investment: "📈", other: "💼",
-        };
-        const PALETTE = ["#0f766e", "#14b8a6", "#5e7fa6", "#d99a4e", "#7c6ba8", "#2e8b72"];
 
         for (const e of entries) {
           if (e.kind === "expense" || e.kind === "income") {